@@ -0,0 +1,101 @@
+#
+# Copyright (c) Elliot Peele <elliot@bentlogic.net>
+#
+# This program is distributed under the terms of the MIT License as found
+# in a file called LICENSE. If it is not present, the license
+# is always available at http://www.opensource.org/licenses/mit-license.php.
+#
+# This program is distributed in the hope that it will be useful, but
+# without any warrenty; without even the implied warranty of merchantability
+# or fitness for a particular purpose. See the MIT License for full details.
+#
+
+"""
+Compare the memory used to deserialize a large bulk request body into view
+models and AttrDicts against slotted input records and plain dicts.
+
+Requires tracemalloc (pip install pytracemalloc on python 2).
+"""
+
+import sys
+import json
+import tracemalloc
+
+from prism_core.util import AttrDict
+
+from prism_rest.viewmodels import JSONDecoder
+from prism_rest.viewmodels import BaseViewModel
+from prism_rest.viewmodels import register_model
+
+
+@register_model
+class BenchItemModel(BaseViewModel):
+    version = 'bench'
+    model_name = 'bench_item'
+    fields = ('id', 'name', 'description', 'count', 'tags', 'owner', )
+
+
+class FakeRequest(object):
+    charset = 'utf-8'
+
+
+def make_body(count):
+    items = []
+    for i in xrange(count):
+        items.append({
+            'metadata': {
+                'type': BenchItemModel.model_name,
+                'version': BenchItemModel.version,
+            },
+            'id': i,
+            'name': 'item %s' % i,
+            'description': 'description of item %s' % i,
+            'count': i * 2,
+            'tags': ['a', 'b', 'c'],
+            'owner': {'name': 'owner %s' % i, 'email': 'o%s@example.com' % i},
+        })
+    return json.dumps({'data': items})
+
+
+def measure(body, decoder):
+    tracemalloc.start()
+    data = json.loads(body, object_hook=decoder)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current, peak
+
+
+def measure_old(body, request):
+    """
+    Measure decoding with BenchItemModel's input record removed, so that it
+    deserializes onto view model instances the way it did before records.
+    """
+
+    record = BenchItemModel._input_record
+    del BenchItemModel._input_record
+    try:
+        return measure(body, JSONDecoder(request, dict_type=AttrDict))
+    finally:
+        BenchItemModel._input_record = record
+
+
+def main(args):
+    count = args and int(args[0]) or 100000
+    request = FakeRequest()
+
+    body = make_body(count)
+
+    results = [
+        ('old', measure_old(body, request)),
+        ('new', measure(body, JSONDecoder(request))),
+    ]
+
+    print('%s objects, %s bytes of JSON' % (count, len(body)))
+    for name, (current, peak) in results:
+        print('%s: retained %.1f MiB, peak %.1f MiB' % (
+            name, current / 1048576.0, peak / 1048576.0))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
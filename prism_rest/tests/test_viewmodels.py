@@ -0,0 +1,203 @@
+#
+# Copyright (c) Elliot Peele <elliot@bentlogic.net>
+#
+# This program is distributed under the terms of the MIT License as found
+# in a file called LICENSE. If it is not present, the license
+# is always available at http://www.opensource.org/licenses/mit-license.php.
+#
+# This program is distributed in the hope that it will be useful, but
+# without any warrenty; without even the implied warranty of merchantability
+# or fitness for a particular purpose. See the MIT License for full details.
+#
+
+import json
+import unittest
+
+from prism_core.util import AttrDict
+from prism_core.views import BaseView
+
+from prism_rest.viewmodels import JSONDecoder
+from prism_rest.viewmodels import InputRecord
+from prism_rest.viewmodels import view_requires
+from prism_rest.viewmodels import view_provides
+from prism_rest.viewmodels import BaseViewModel
+from prism_rest.viewmodels import register_model
+
+
+@register_model
+class ItemModel(BaseViewModel):
+    version = None
+    model_name = 'test_item'
+    fields = ('id', 'name', 'owner', )
+
+
+@register_model
+class AttrItemModel(BaseViewModel):
+    version = None
+    model_name = 'test_attr_item'
+    fields = ('id', 'owner', )
+    attr_access = True
+
+
+@register_model
+class CustomItemModel(BaseViewModel):
+    version = None
+    model_name = 'test_custom_item'
+    fields = ('id', 'when', )
+
+    def deserialize(self, data):
+        record = BaseViewModel.deserialize(self, data)
+        record.when = 'custom'
+        return record
+
+
+class UnregisteredItemModel(ItemModel):
+    fields = ('id', 'name', 'owner', 'extra', )
+
+
+class FakeItem(object):
+    id = 1
+    name = 'one'
+    owner = None
+
+
+class FakeRequest(object):
+    charset = 'utf-8'
+
+    def __init__(self, body=None):
+        self.body = body
+
+
+class FakeView(BaseView):
+    def __init__(self, request):
+        self.request = request
+
+    @view_requires('test_item')
+    def item(self):
+        return self.request.input_model
+
+    @view_requires('test_attr_item')
+    def attr_item(self):
+        return self.request.input_model
+
+    @view_requires('test_custom_item')
+    def custom_item(self):
+        return self.request.input_model
+
+    @view_provides('test_item')
+    def provide_item(self):
+        return FakeItem()
+
+
+def item(id, model=ItemModel, **kwargs):
+    data = {
+        'metadata': {'type': model.model_name, 'version': model.version},
+        'id': id,
+    }
+    data.update(kwargs)
+    return data
+
+
+class InputRecordTest(unittest.TestCase):
+    def test_register_model(self):
+        record = ItemModel._input_record
+        self.assertTrue(issubclass(record, InputRecord))
+        self.assertEqual(record.__name__, 'ItemModelInput')
+        self.assertEqual(record.__slots__, ('id', 'name', 'owner', 'metadata'))
+
+    def test_deserialize(self):
+        data = item(1, name='one')
+        model = ItemModel(FakeRequest()).deserialize(data)
+        self.assertTrue(isinstance(model, ItemModel._input_record))
+        self.assertEqual(model.id, 1)
+        self.assertEqual(model.name, 'one')
+        self.assertEqual(model.owner, None)
+        self.assertEqual(model.metadata, data['metadata'])
+        self.assertFalse(hasattr(model, '__dict__'))
+
+    def test_deserialize_unregistered(self):
+        model = UnregisteredItemModel(FakeRequest())
+        self.assertTrue(model.deserialize({'extra': 1}) is model)
+        self.assertEqual(model.extra, 1)
+        self.assertEqual(model.id, None)
+
+    def test_reserved_fields(self):
+        class BadModel(BaseViewModel):
+            version = None
+            model_name = 'test_bad'
+            fields = ('id', '_fields', )
+        self.assertRaises(AssertionError, register_model, BadModel)
+
+    def test_invalid_fields(self):
+        class BadModel(BaseViewModel):
+            version = None
+            model_name = 'test_bad'
+            fields = ('id', 'a-b', )
+        self.assertRaises(AssertionError, register_model, BadModel)
+
+
+class JSONDecoderTest(unittest.TestCase):
+    def loads(self, data, **kwargs):
+        return json.loads(json.dumps(data),
+            object_hook=JSONDecoder(FakeRequest(), **kwargs))
+
+    def test_plain_dicts(self):
+        data = self.loads({'a': {'b': 1}})
+        self.assertTrue(type(data) is dict)
+        self.assertTrue(type(data['a']) is dict)
+
+    def test_attr_dicts(self):
+        data = self.loads({'a': {'b': 1}}, dict_type=AttrDict)
+        self.assertTrue(isinstance(data, AttrDict))
+        self.assertEqual(data.a.b, 1)
+
+    def test_nested_models(self):
+        data = self.loads({'data': [item(1), item(2, owner={'b': 1})]})
+        first, second = data['data']
+        self.assertTrue(isinstance(first, ItemModel._input_record))
+        self.assertEqual(first.id, 1)
+        self.assertEqual(second.id, 2)
+        self.assertTrue(type(second.owner) is dict)
+
+    def test_nested_custom_deserialize(self):
+        data = self.loads({'data': [item(1, model=CustomItemModel,
+            when='x')]})
+        self.assertEqual(data['data'][0].when, 'custom')
+
+
+class ViewRequiresTest(unittest.TestCase):
+    def test_body(self):
+        body = json.dumps({'id': 1, 'owner': {'name': 'me'}})
+        model = FakeView(FakeRequest(body)).item()
+        self.assertTrue(isinstance(model, ItemModel._input_record))
+        self.assertEqual(model.id, 1)
+        self.assertEqual(model.owner, {'name': 'me'})
+        self.assertTrue(type(model.owner) is dict)
+
+    def test_empty_body(self):
+        for body in (None, ''):
+            model = FakeView(FakeRequest(body)).item()
+            self.assertTrue(isinstance(model, ItemModel._input_record))
+            self.assertEqual(model.id, None)
+            self.assertEqual(model.metadata, None)
+
+    def test_attr_access(self):
+        body = json.dumps({'id': 1, 'owner': {'name': 'me'}})
+        model = FakeView(FakeRequest(body)).attr_item()
+        self.assertTrue(isinstance(model.owner, AttrDict))
+        self.assertEqual(model.owner.name, 'me')
+
+    def test_custom_deserialize(self):
+        for body in (None, json.dumps({'id': 1, 'when': 'x'})):
+            model = FakeView(FakeRequest(body)).custom_item()
+            self.assertTrue(isinstance(model, CustomItemModel._input_record))
+            self.assertEqual(model.when, 'custom')
+
+
+class ViewProvidesTest(unittest.TestCase):
+    def test_provides(self):
+        for body in (None, json.dumps({'id': 2, 'name': 'two'})):
+            output = FakeView(FakeRequest(body)).provide_item()
+            self.assertEqual(output['id'], 1)
+            self.assertEqual(output['name'], 'one')
+            self.assertEqual(output['metadata']['type'], 'test_item')
@@ -26,6 +26,8 @@ from prism_rest.errors import ViewModelNotFoundError
 
 log = logging.getLogger('prism.rest.viewmodels')
 
+_identifier = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*\Z')
+
 class _base(object):
     """
     Base class for requires and provides view model decorators.
@@ -56,6 +58,12 @@ class _base(object):
                 'requires view models are subclasses of BaseViewModel'
                 % self.__class__.__name__)
 
+        # Only wrap plain JSON objects in AttrDicts if one of the models
+        # actually wants attribute access to them.
+        dict_type = dict
+        if any(x.attr_access for x in modelClses.itervalues()):
+            dict_type = AttrDict
+
         def wrapper(inst, *args, **kwargs):
             assert isinstance(inst, BaseView), ('%s decorator only supported '
                 'for instances of BaseView.' % self.__class__.__name__)
@@ -64,15 +72,13 @@ class _base(object):
             if getattr(inst.request, 'body', None):
                 data = json.loads(
                     text_(inst.request.body, inst.request.charset),
-                    object_hook=JSONDecoder(inst.request))
+                    object_hook=JSONDecoder(inst.request, dict_type=dict_type))
 
             model = None
             if not data or isinstance(data, dict):
                 # If nothing matches, pick the first one?
                 modelCls = sorted(modelClses.items())[0][1]
-                model = modelCls(inst.request)
-                if data:
-                    model.deserialize(data)
+                model = self._make_model(modelCls, inst.request, data)
 
             return self._wrap(model or data, func, inst, *args, **kwargs)
 
@@ -84,6 +90,19 @@ class _base(object):
         assert issubclass(mcls, AbstractViewModel), ('All view models must '
             'decend from BaseViewModel.')
         cls._view_model_types[(mcls.version, mcls.model_name)] = mcls
+
+        # Generate a slotted record type for holding input data so that
+        # deserializing doesn't need a full view model instance per object.
+        if issubclass(mcls, BaseViewModel):
+            invalid = [ x for x in mcls.fields if not _identifier.match(x) ]
+            assert not invalid, ('View model %s has fields that are not valid '
+                'identifiers: %s' % (mcls.__name__, ', '.join(invalid)))
+            reserved = set(mcls.fields) & set(dir(InputRecord))
+            assert not reserved, ('View model %s has fields that conflict '
+                'with input record attributes: %s' % (mcls.__name__,
+                ', '.join(sorted(reserved))))
+            mcls._input_record = make_input_record(mcls)
+
         return mcls
 
     @classmethod
@@ -108,6 +127,9 @@ class _base(object):
                 'found' % model_name)
         return model
 
+    def _make_model(self, modelCls, request, data):
+        return modelCls(request)
+
     def _wrap(self, model, func, inst, *args, **kwargs):
         raise NotImplementedError
 
@@ -126,6 +148,19 @@ class view_requires(_base):
           core.views.BaseView.
           model_name must be a subclass of BaseViewModel.
     """
+    def _make_model(self, modelCls, request, data):
+        if modelCls._get_input_record() is None:
+            model = modelCls(request)
+            if data:
+                model = model.deserialize(data)
+            return model
+
+        # Registered models always provide a record, even for empty input.
+        record = modelCls._get_record_shortcut()
+        if record is not None:
+            return record(data or {})
+        return modelCls(request).deserialize(data or {})
+
     def _wrap(self, model, func, inst, *args, **kwargs):
         inst.request.input_model = model
         return func(inst, *args, **kwargs)
@@ -152,8 +187,9 @@ class JSONDecoder(object):
 
     _decoders = {}
 
-    def __init__(self, request):
+    def __init__(self, request, dict_type=dict):
         self.request = request
+        self.dict_type = dict_type
 
     def __call__(self, pairs):
         md = pairs.get('metadata')
@@ -162,10 +198,14 @@ class JSONDecoder(object):
             model_version = md.get('version')
 
             modelCls = get_model_by_name(model_name, model_version)
+            record = modelCls._get_record_shortcut()
+            if record is not None:
+                return record(pairs)
+
             model = modelCls(self.request)
             return model.deserialize(pairs)
 
-        data = AttrDict()
+        data = self.dict_type()
         for k, v in pairs.iteritems():
             decoder = self.get_decoder(v)
             if decoder:
@@ -196,10 +236,52 @@ def register_decoder(matchStr):
     return deco
 
 
+class InputRecord(object):
+    """
+    Base class for the slotted records generated by register_model to hold
+    deserialized input data. As with a deserialized view model, fields missing
+    from the input are set to None.
+    """
+
+    __slots__ = ()
+
+    _fields = ()
+
+    def __init__(self, data):
+        for field in self._fields:
+            setattr(self, field, data.get(field))
+        self.metadata = data.get('metadata')
+
+    def __repr__(self):
+        return '<%s %s>' % (self.__class__.__name__, ', '.join(
+            '%s=%r' % (x, getattr(self, x)) for x in self.__slots__))
+
+
+def make_input_record(mcls):
+    """
+    Generate an InputRecord subclass with a slot for each of the fields of the
+    given view model class.
+    """
+
+    fields = tuple(mcls.fields)
+    slots = fields
+    if 'metadata' not in slots:
+        slots += ('metadata', )
+
+    return type('%sInput' % mcls.__name__, (InputRecord, ), {
+        '__slots__': slots,
+        '_fields': fields,
+    })
+
+
 class AbstractViewModel(object):
     """
     Abstract class to define the interface that all view model implemenations
     should implement.
+
+    attr_access - Decode plain JSON objects in the input into AttrDicts so
+                  that nested data can be read as attributes. By default they
+                  are decoded into plain dicts.
     """
 
     version = None
@@ -208,11 +290,26 @@ class AbstractViewModel(object):
     dbmodelCls = None
     static_model = False
 
+    attr_access = False
+
     id_fields = {}
 
     def __init__(self, request):
         self.request = request
 
+    @classmethod
+    def _get_input_record(cls):
+        # Only look on the class itself, subclasses may declare other fields.
+        return cls.__dict__.get('_input_record')
+
+    @classmethod
+    def _get_record_shortcut(cls):
+        # The record can only be built without the view model when the model
+        # doesn't override deserialize.
+        if cls.deserialize.im_func is not BaseViewModel.deserialize.im_func:
+            return None
+        return cls._get_input_record()
+
     def _get_var_dict(self, dbmodel, args):
         if not isinstance(args, (list, tuple, set)):
             args = [ args, ]
@@ -274,6 +371,7 @@ class BaseViewModel(AbstractViewModel):
     fields - The list of attributes that should be copied from the
              database model or expected to be in the input model.
     id_fields - Fields that should be turned into urls.
+    attr_access - See AbstractViewModel.
     """
 
     fields = ()
@@ -305,6 +403,16 @@ class BaseViewModel(AbstractViewModel):
         return output
 
     def deserialize(self, data):
+        """
+        Models registered with register_model return a new instance of their
+        generated input record. Unregistered models, including unregistered
+        subclasses of registered models, set the fields on and return self.
+        """
+
+        record = self._get_input_record()
+        if record is not None:
+            return record(data)
+
         for field in self.fields:
             if field in data:
                 setattr(self, field, data.get(field))